@@ -0,0 +1,35 @@
+-- Migration: Add composite lookup indexes to flights
+-- Description: Covers the flights access paths that the existing
+--   (user_id, month, year) index cannot serve efficiently:
+--   - yearly reads (statistics) filter on user_id + year only, which skips the
+--     middle column of (user_id, month, year)
+--   - date-range reads (cross-month layover lookahead) filter on
+--     user_id + date, while idx_flights_date is not scoped by user
+-- Affected tables: flights
+-- Date: 2026-10-15
+-- Special notes: Replaces idx_flights_user_month_year. Per-month queries
+--   filter on equality of user_id, year and month, which the reordered
+--   (user_id, year, month) index serves equally well, so keeping both would
+--   only add write and storage overhead.
+
+-- =====================================================
+-- 1. user + year (+ month) lookups
+-- =====================================================
+
+-- Serves WHERE user_id = ? AND year = ? [AND month = ?] ORDER BY date.
+-- Placing year before month lets a single index answer both the yearly
+-- statistics query and the per-month roster queries.
+create index if not exists idx_flights_user_year_month
+  on public.flights (user_id, year, month);
+
+-- Superseded by idx_flights_user_year_month
+drop index if exists public.idx_flights_user_month_year;
+
+-- =====================================================
+-- 2. user + date range lookups
+-- =====================================================
+
+-- Serves WHERE user_id = ? AND date BETWEEN ? AND ? ORDER BY date, used by
+-- getFlightDutiesByMonthWithLookahead for cross-month layover pairing.
+create index if not exists idx_flights_user_date
+  on public.flights (user_id, date);
@@ -0,0 +1,44 @@
+-- Migration: Enforce one friendship row per user pair regardless of direction
+-- Description: unique_friendship only covers (requester_id, receiver_id), so
+--   A->B and B->A could coexist when two users send requests to each other at
+--   the same time (sendFriendRequest checks both directions before inserting,
+--   but the check and the insert are not atomic). Replaces it with a
+--   direction-agnostic unique index.
+-- Affected tables: friendships
+-- Date: 2026-10-15
+-- Special notes: Safe to apply before or after the matching application
+--   change. Existing reversed duplicates are removed first, keeping the most
+--   advanced row per pair (accepted > pending > rejected), then the oldest.
+
+-- =====================================================
+-- 1. Remove existing reversed duplicates
+-- =====================================================
+
+with ranked as (
+  select
+    id,
+    row_number() over (
+      partition by least(requester_id, receiver_id), greatest(requester_id, receiver_id)
+      order by
+        case status when 'accepted' then 0 when 'pending' then 1 else 2 end,
+        created_at,
+        id
+    ) as pair_rank
+  from public.friendships
+)
+delete from public.friendships f
+using ranked r
+where f.id = r.id
+  and r.pair_rank > 1;
+
+-- =====================================================
+-- 2. Direction-agnostic pair uniqueness
+-- =====================================================
+
+create unique index if not exists idx_friendships_unique_pair
+  on public.friendships (least(requester_id, receiver_id), greatest(requester_id, receiver_id));
+
+-- Superseded by idx_friendships_unique_pair (any duplicate it would reject is
+-- also rejected by the pair index)
+alter table public.friendships
+  drop constraint if exists unique_friendship;
@@ -0,0 +1,30 @@
+-- Migration: Link profiles.id to auth.users.id
+-- Description: handle_new_user creates each profile with id = auth.users.id, but
+--   that relationship is only a convention of the trigger. Declares it as a
+--   foreign key with on delete cascade so a profile can never outlive (or exist
+--   without) its auth user, and so PostgREST can embed across the relationship.
+-- Affected tables: profiles
+-- Date: 2026-10-15
+-- Special notes: Guarded so it is a no-op where the constraint was already
+--   created from the Supabase dashboard. Fails if orphaned profile rows exist;
+--   remove them before applying.
+
+-- =====================================================
+-- 1. profiles.id -> auth.users.id
+-- =====================================================
+
+do $$
+begin
+  if not exists (
+    select 1
+    from pg_constraint c
+    where c.conrelid = 'public.profiles'::regclass
+      and c.confrelid = 'auth.users'::regclass
+      and c.contype = 'f'
+  ) then
+    alter table public.profiles
+      add constraint profiles_id_fkey
+      foreign key (id) references auth.users(id) on delete cascade;
+  end if;
+end;
+$$;
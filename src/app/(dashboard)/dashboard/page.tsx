@@ -27,7 +27,7 @@ import { deleteFlightDuty } from '@/lib/database/flights';
 import { FlightDutiesManager } from '@/components/salary-calculator/FlightDutiesManager';
 import { useToast } from '@/hooks/use-toast';
 import { useMobileNavigation } from '@/contexts/MobileNavigationProvider';
-import { getProfile } from '@/lib/db';
+import { getProfileClaims } from '@/lib/db';
 import { useDataRefresh } from '@/hooks/useDataRefresh';
 import { useFlightDuties } from '@/hooks/useFlightDuties';
 import { useMonthlyCalculations } from '@/hooks/useMonthlyCalculations';
@@ -76,7 +76,7 @@ export default function DashboardPage() {
       if (!user?.id) return;
 
       try {
-        const { data: profile, error } = await getProfile(user.id);
+        const { data: profile, error } = await getProfileClaims(user.id);
 
         if (profile && !error && profile.position) {
           setUserPosition(profile.position as Position);
@@ -201,7 +201,7 @@ export default function DashboardPage() {
     if (!user?.id) return;
 
     try {
-      const { data: profile, error } = await getProfile(user.id);
+      const { data: profile, error } = await getProfileClaims(user.id);
 
       if (profile && !error && profile.position) {
         setUserPosition(profile.position as Position);
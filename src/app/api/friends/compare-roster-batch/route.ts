@@ -11,7 +11,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { createClient as createSupabaseClient } from '@supabase/supabase-js';
 import type { Database } from '@/lib/supabase';
 import type { FlightDuty } from '@/types/salary-calculator';
-import { rowToFlightDuty } from '@/lib/database/flights';
+import { rowToFlightDuty, ROSTER_COMPARISON_COLUMNS } from '@/lib/database/flights';
 import { createServiceClient } from '@/lib/supabase-service';
 import { MIN_SUPPORTED_YEAR } from '@/lib/constants/dates';
 import { parsePreferences } from '@/lib/user-preferences';
@@ -182,99 +182,96 @@ export async function GET(request: NextRequest) {
     // ========================================================================
     const { data: friendSettingsRows } = await serviceSupabase
       .from('user_settings')
-      .select('user_id, settings')
+      .select('user_id, hideRosterFromFriends:settings->hideRosterFromFriends')
       .in('user_id', friendIds);
 
-    // Build a map of friendId -> hideRosterFromFriends
-    type SettingsRow = { user_id: string; settings: Record<string, unknown> };
+    // Build a map of friendId -> hideRosterFromFriends. Only that key is
+    // extracted from the settings JSON, not the whole settings document.
+    type SettingsRow = { user_id: string; hideRosterFromFriends: unknown };
     const settingsRowsTyped = (friendSettingsRows || []) as unknown as SettingsRow[];
     
     const hiddenRosterMap = new Map<string, boolean>();
     for (const row of settingsRowsTyped) {
-      const prefs = parsePreferences(row.settings);
+      const prefs = parsePreferences({ hideRosterFromFriends: row.hideRosterFromFriends });
       hiddenRosterMap.set(row.user_id, prefs.hideRosterFromFriends);
     }
 
     // ========================================================================
-    // Fetch all rosters in parallel (user + all friends)
+    // Fetch all rosters in a single query (user + visible friends)
     // ========================================================================
     type FlightRow = Database['public']['Tables']['flights']['Row'];
 
     const sanitizeRoster = (rows: FlightRow[]): FlightDuty[] => {
       return rows.map((row) => {
         const duty = rowToFlightDuty(row);
-        // Never expose salary information in friends comparison
-        return {
-          ...duty,
-          flightPay: 0,
-        };
+
+        // Never expose salary information in friends comparison. The duty is
+        // freshly built for this response, so it is cleared in place rather
+        // than copied.
+        duty.flightPay = 0;
+        return duty;
       });
     };
 
-    // Fetch user's roster
-    const myRosterPromise = serviceSupabase
-      .from('flights')
-      .select('*')
-      .eq('user_id', user.id)
-      .eq('month', month)
-      .eq('year', year)
-      .order('date', { ascending: true });
-
-    // Fetch all friends' rosters in parallel
-    const friendRosterPromises = friendIds.map((friendId) =>
+    // Hidden rosters are never returned, so there is no need to fetch them
+    const visibleFriendIds = friendIds.filter(
+      (friendId) => !(hiddenRosterMap.get(friendId) || false)
+    );
+
+    const fetchRosterRows = (userIds: string[]) =>
       serviceSupabase
         .from('flights')
-        .select('*')
-        .eq('user_id', friendId)
+        .select(ROSTER_COMPARISON_COLUMNS)
+        .in('user_id', userIds)
         .eq('month', month)
         .eq('year', year)
-        .order('date', { ascending: true })
-        .then((result) => ({
-          friendId,
-          result,
-          rosterHidden: hiddenRosterMap.get(friendId) || false,
-        }))
-    );
+        .order('date', { ascending: true });
+
+    let rosterResult = await fetchRosterRows([user.id, ...visibleFriendIds]);
 
-    // Execute all fetches in parallel
-    const [myRosterResult, ...friendResults] = await Promise.all([
-      myRosterPromise,
-      ...friendRosterPromises,
-    ]);
+    // If the combined fetch fails, retry with only the user's own roster and
+    // report friends' rosters as unavailable, so one bad fetch still yields a
+    // partial result rather than failing the whole comparison
+    let friendRostersFailed = false;
+    if (rosterResult.error && visibleFriendIds.length > 0) {
+      friendRostersFailed = true;
+      rosterResult = await fetchRosterRows([user.id]);
+    }
 
-    if (myRosterResult.error) {
+    if (rosterResult.error) {
       return NextResponse.json(
         { error: 'Failed to fetch your roster' },
         { status: 500 }
       );
     }
 
-    // Process friend results
-    const friends: FriendRosterData[] = friendResults.map(
-      ({ friendId, result, rosterHidden }) => {
-        if (result.error) {
-          // If we can't fetch a friend's roster, return empty with error flag
-          // We could also choose to fail the entire request, but partial data is more resilient
-          return {
-            friendId,
-            roster: [],
-            rosterHidden: true, // Treat fetch errors as hidden for UI purposes
-          };
-        }
-
-        return {
-          friendId,
-          roster: rosterHidden ? [] : sanitizeRoster(result.data || []),
-          rosterHidden,
-        };
+    // Group rows by owner, preserving the date ordering from the query
+    const rowsByUserId = new Map<string, FlightRow[]>();
+    for (const row of (rosterResult.data ?? []) as unknown as FlightRow[]) {
+      const rows = rowsByUserId.get(row.user_id);
+      if (rows) {
+        rows.push(row);
+      } else {
+        rowsByUserId.set(row.user_id, [row]);
       }
-    );
+    }
+
+    const friends: FriendRosterData[] = friendIds.map((friendId) => {
+      // Treat fetch errors as hidden for UI purposes
+      const rosterHidden = friendRostersFailed || hiddenRosterMap.get(friendId) || false;
+
+      return {
+        friendId,
+        roster: rosterHidden ? [] : sanitizeRoster(rowsByUserId.get(friendId) || []),
+        rosterHidden,
+      };
+    });
 
     // ========================================================================
     // Return combined response
     // ========================================================================
     const response: BatchCompareResponse = {
-      myRoster: sanitizeRoster(myRosterResult.data || []),
+      myRoster: sanitizeRoster(rowsByUserId.get(user.id) || []),
       friends,
       month,
       year,
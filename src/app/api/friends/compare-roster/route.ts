@@ -9,7 +9,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { createClient as createSupabaseClient } from '@supabase/supabase-js';
 import type { Database } from '@/lib/supabase';
 import type { FlightDuty } from '@/types/salary-calculator';
-import { rowToFlightDuty } from '@/lib/database/flights';
+import { rowToFlightDuty, ROSTER_COMPARISON_COLUMNS } from '@/lib/database/flights';
 import { createServiceClient } from '@/lib/supabase-service';
 import { MIN_SUPPORTED_YEAR } from '@/lib/constants/dates';
 import { parsePreferences } from '@/lib/user-preferences';
@@ -106,7 +106,7 @@ export async function GET(request: NextRequest) {
     // Check if the friend has hidden their roster
     const { data: friendSettings } = await serviceSupabase
       .from('user_settings')
-      .select('settings')
+      .select('hideRosterFromFriends:settings->hideRosterFromFriends')
       .eq('user_id', friendId)
       .maybeSingle();
 
@@ -114,40 +114,28 @@ export async function GET(request: NextRequest) {
     // Our hand-written `Database` types can cause Supabase select() inference to become `never`
     // during production type-checking (Netlify). We intentionally narrow via `unknown` here
     // to keep this route type-safe without using `any`.
-    type FriendSettingsRow = { settings: Record<string, unknown> } | null;
+    // Only the hideRosterFromFriends key is extracted from the settings JSON,
+    // so the rest of the settings document never leaves the database.
+    type FriendSettingsRow = { hideRosterFromFriends: unknown } | null;
     const friendSettingsRow = friendSettings as unknown as FriendSettingsRow;
 
-    const friendPreferences = parsePreferences(friendSettingsRow?.settings);
+    const friendPreferences = parsePreferences(friendSettingsRow);
     const friendRosterHidden = friendPreferences.hideRosterFromFriends;
 
-    // Fetch both users' rosters in parallel
-    const [myRosterResult, friendRosterResult] = await Promise.all([
-      serviceSupabase
-        .from('flights')
-        .select('*')
-        .eq('user_id', user.id)
-        .eq('month', month)
-        .eq('year', year)
-        .order('date', { ascending: true }),
-      serviceSupabase
-        .from('flights')
-        .select('*')
-        .eq('user_id', friendId)
-        .eq('month', month)
-        .eq('year', year)
-        .order('date', { ascending: true })
-    ]);
-
-    if (myRosterResult.error) {
-      return NextResponse.json(
-        { error: 'Failed to fetch your roster' },
-        { status: 500 }
-      );
-    }
+    // Fetch both users' rosters in a single query (the friend's only if visible)
+    const rosterUserIds = friendRosterHidden ? [user.id] : [user.id, friendId];
+
+    const { data: rosterRows, error: rosterError } = await serviceSupabase
+      .from('flights')
+      .select(ROSTER_COMPARISON_COLUMNS)
+      .in('user_id', rosterUserIds)
+      .eq('month', month)
+      .eq('year', year)
+      .order('date', { ascending: true });
 
-    if (friendRosterResult.error) {
+    if (rosterError) {
       return NextResponse.json(
-        { error: 'Failed to fetch friend roster' },
+        { error: 'Failed to fetch rosters' },
         { status: 500 }
       );
     }
@@ -155,23 +143,27 @@ export async function GET(request: NextRequest) {
     // Remove salary-related fields from both rosters and map to FlightDuty shape
     type FlightRow = Database['public']['Tables']['flights']['Row'];
 
+    const rosterRowsTyped = (rosterRows ?? []) as unknown as FlightRow[];
+    const myRosterRows = rosterRowsTyped.filter((row) => row.user_id === user.id);
+    const friendRosterRows = rosterRowsTyped.filter((row) => row.user_id === friendId);
+
     const sanitizeRoster = (rows: FlightRow[]): FlightDuty[] => {
       return rows.map((row) => {
         const duty = rowToFlightDuty(row);
 
-        // Never expose salary information in friends comparison
-        return {
-          ...duty,
-          flightPay: 0,
-        };
+        // Never expose salary information in friends comparison. The duty is
+        // freshly built for this response, so it is cleared in place rather
+        // than copied.
+        duty.flightPay = 0;
+        return duty;
       });
     };
 
     return NextResponse.json(
       {
-        myRoster: sanitizeRoster(myRosterResult.data || []),
+        myRoster: sanitizeRoster(myRosterRows),
         // Return empty roster if friend has hidden it, but include flag for UI
-        friendRoster: friendRosterHidden ? [] : sanitizeRoster(friendRosterResult.data || []),
+        friendRoster: friendRosterHidden ? [] : sanitizeRoster(friendRosterRows),
         friendRosterHidden,
         month,
         year,
@@ -8,7 +8,6 @@ import { uploadAvatar } from '@/lib/fileUpload';
 import { updateUserAvatar } from '@/lib/userProfile';
 import { validateImageFile, ALLOWED_FILE_TYPES } from '@/lib/fileValidation';
 import { setupAvatarsBucket } from '@/lib/setupStorage';
-import { getProfile } from '@/lib/db';
 import { Upload } from 'lucide-react';
 
 // Default avatar as a data URL (simple user silhouette)
@@ -28,24 +27,17 @@ export function AvatarUpload({ onUploadComplete, size = 150 }: AvatarUploadProps
   const [preview, setPreview] = useState<string | null>(null);
   const [selectedFile, setSelectedFile] = useState<File | null>(null);
 
+  // Load avatar URL from the shared profile (already fetched by ProfileProvider)
+  const hasProfile = profile !== null;
+  const profileAvatarUrl = profile?.avatar_url;
   useEffect(() => {
-    // Load avatar URL from database profile (source of truth)
-    const loadAvatar = async () => {
-      if (user?.id) {
-        try {
-          const { data: profile, error } = await getProfile(user.id);
-          if (profile && !error) {
-            setAvatarUrl(profile.avatar_url || null);
-          }
-        } catch {
-          // Fallback to auth metadata if database fails
-          setAvatarUrl(user?.user_metadata?.avatar_url || null);
-        }
-      }
-    };
-
-    loadAvatar();
-  }, [user?.id, user?.user_metadata?.avatar_url]);
+    if (hasProfile) {
+      setAvatarUrl(profileAvatarUrl || null);
+    } else {
+      // Fallback to auth metadata if the profile is unavailable
+      setAvatarUrl(user?.user_metadata?.avatar_url || null);
+    }
+  }, [hasProfile, profileAvatarUrl, user?.user_metadata?.avatar_url]);
 
   // Create a preview when a file is selected
   useEffect(() => {
@@ -4,7 +4,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '@/contexts/AuthProvider';
 import { useProfile } from '@/contexts/ProfileProvider';
 import { Input } from '@/components/ui/input';
-import { getProfile, updateProfile } from '@/lib/db';
+import { updateProfile } from '@/lib/db';
 import { ProfileSettingsRow } from './ProfileSettingsRow';
 import { Button } from '@/components/ui/button';
 
@@ -19,25 +19,11 @@ export function NameUpdate() {
   const [error, setError] = useState<string | null>(null);
   const successTimeoutRef = useRef<NodeJS.Timeout | null>(null);
 
-  // Load name from database profile (source of truth)
+  // Load name from the shared profile (already fetched by ProfileProvider)
   useEffect(() => {
-    const loadName = async () => {
-      if (user?.id) {
-        try {
-          const { data: profile, error } = await getProfile(user.id);
-          if (profile && !error) {
-            setFirstName(profile.first_name || '');
-            setLastName(profile.last_name || '');
-          }
-        } catch {
-          setFirstName('');
-          setLastName('');
-        }
-      }
-    };
-
-    loadName();
-  }, [user?.id]);
+    setFirstName(profile?.first_name || '');
+    setLastName(profile?.last_name || '');
+  }, [profile?.first_name, profile?.last_name]);
 
   // Cleanup timeout on unmount
   useEffect(() => {
@@ -91,20 +77,10 @@ export function NameUpdate() {
     }
   };
 
-  const handleCancel = async () => {
-    // Reset to original values from database
-    if (user?.id) {
-      try {
-        const { data: profile, error } = await getProfile(user.id);
-        if (profile && !error) {
-          setFirstName(profile.first_name || '');
-          setLastName(profile.last_name || '');
-        }
-      } catch {
-        setFirstName('');
-        setLastName('');
-      }
-    }
+  const handleCancel = () => {
+    // Reset to original values from the shared profile
+    setFirstName(profile?.first_name || '');
+    setLastName(profile?.last_name || '');
     setIsEditing(false);
     setError(null);
   };
@@ -2,15 +2,16 @@
 
 import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '@/contexts/AuthProvider';
+import { useProfile } from '@/contexts/ProfileProvider';
 import { CountrySelect } from '@/components/ui/CountrySelect';
 import { updateUserNationality } from '@/lib/userProfile';
-import { getProfile } from '@/lib/db';
 import { getCountryName } from '@/lib/countryUtils';
 import { ProfileSettingsRow } from './ProfileSettingsRow';
 import { Button } from '@/components/ui/button';
 
 export function NationalityUpdate() {
   const { user, loading: authLoading } = useAuth();
+  const { profile, setProfile } = useProfile();
   const [nationality, setNationality] = useState<string>('');
   const [isEditing, setIsEditing] = useState(false);
   const [isUpdating, setIsUpdating] = useState(false);
@@ -18,24 +19,17 @@ export function NationalityUpdate() {
   const [error, setError] = useState<string | null>(null);
   const successTimeoutRef = useRef<NodeJS.Timeout | null>(null);
 
-  // Load nationality from database profile (source of truth)
+  // Load nationality from the shared profile (already fetched by ProfileProvider)
+  const hasProfile = profile !== null;
+  const profileNationality = profile?.nationality;
   useEffect(() => {
-    const loadNationality = async () => {
-      if (user?.id) {
-        try {
-          const { data: profile, error } = await getProfile(user.id);
-          if (profile && !error) {
-            setNationality(profile.nationality || '');
-          }
-        } catch {
-          // Fallback to auth metadata if database fails
-          setNationality(user?.user_metadata?.nationality || '');
-        }
-      }
-    };
-
-    loadNationality();
-  }, [user?.id, user?.user_metadata?.nationality]);
+    if (hasProfile) {
+      setNationality(profileNationality || '');
+    } else {
+      // Fallback to auth metadata if the profile is unavailable
+      setNationality(user?.user_metadata?.nationality || '');
+    }
+  }, [hasProfile, profileNationality, user?.user_metadata?.nationality]);
 
   // Cleanup timeout on unmount
   useEffect(() => {
@@ -62,6 +56,11 @@ export function NationalityUpdate() {
         throw new Error(result.error || 'Failed to update nationality');
       }
 
+      // Update shared profile state immediately so changes propagate across the app
+      if (profile) {
+        setProfile({ ...profile, nationality });
+      }
+
       setUpdateSuccess(true);
       setIsEditing(false);
 
@@ -80,18 +79,12 @@ export function NationalityUpdate() {
     }
   };
 
-  const handleCancel = async () => {
-    // Reset to original value from database
-    if (user?.id) {
-      try {
-        const { data: profile, error } = await getProfile(user.id);
-        if (profile && !error) {
-          setNationality(profile.nationality || '');
-        }
-      } catch {
-        // Fallback to auth metadata if database fails
-        setNationality(user?.user_metadata?.nationality || '');
-      }
+  const handleCancel = () => {
+    // Reset to original value from the shared profile
+    if (profile) {
+      setNationality(profile.nationality || '');
+    } else {
+      setNationality(user?.user_metadata?.nationality || '');
     }
     setIsEditing(false);
     setError(null);
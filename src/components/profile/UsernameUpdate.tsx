@@ -4,7 +4,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '@/contexts/AuthProvider';
 import { useProfile } from '@/contexts/ProfileProvider';
 import { Input } from '@/components/ui/input';
-import { getProfile, updateProfile } from '@/lib/db';
+import { updateProfile } from '@/lib/db';
 import { ProfileSettingsRow } from './ProfileSettingsRow';
 import { Button } from '@/components/ui/button';
 
@@ -18,23 +18,10 @@ export function UsernameUpdate() {
   const [error, setError] = useState<string | null>(null);
   const successTimeoutRef = useRef<NodeJS.Timeout | null>(null);
 
-  // Load username from database profile (source of truth)
+  // Load username from the shared profile (already fetched by ProfileProvider)
   useEffect(() => {
-    const loadUsername = async () => {
-      if (user?.id) {
-        try {
-          const { data: profile, error } = await getProfile(user.id);
-          if (profile && !error) {
-            setUsername(profile.username || '');
-          }
-        } catch {
-          setUsername('');
-        }
-      }
-    };
-
-    loadUsername();
-  }, [user?.id]);
+    setUsername(profile?.username || '');
+  }, [profile?.username]);
 
   // Cleanup timeout on unmount
   useEffect(() => {
@@ -105,18 +92,9 @@ export function UsernameUpdate() {
     }
   };
 
-  const handleCancel = async () => {
-    // Reset to original value from database
-    if (user?.id) {
-      try {
-        const { data: profile, error } = await getProfile(user.id);
-        if (profile && !error) {
-          setUsername(profile.username || '');
-        }
-      } catch {
-        setUsername('');
-      }
-    }
+  const handleCancel = () => {
+    // Reset to original value from the shared profile
+    setUsername(profile?.username || '');
     setIsEditing(false);
     setError(null);
   };
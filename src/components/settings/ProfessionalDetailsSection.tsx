@@ -8,7 +8,7 @@ import { ProfileSettingsRow } from '@/components/profile/ProfileSettingsRow';
 import { PositionUpdate } from '@/components/profile/PositionUpdate';
 import { getPositionName } from '@/lib/positionUtils';
 import { getPositionRatesForDate } from '@/lib/salary-calculator/calculation-engine';
-import { getProfile } from '@/lib/db';
+import { getProfileClaims } from '@/lib/db';
 import { Position, SalaryRates } from '@/types/salary-calculator';
 import { Loader2, Info } from 'lucide-react';
 
@@ -39,7 +39,7 @@ export const ProfessionalDetailsSection = () => {
 
     setPositionLoading(true);
     try {
-      const { data: freshProfile, error } = await getProfile(user.id);
+      const { data: freshProfile, error } = await getProfileClaims(user.id);
       if (freshProfile && !error && freshProfile.position) {
         setCurrentPosition(freshProfile.position as Position);
       }
@@ -13,6 +13,35 @@ import { formatTimeValue, parseTimeString } from '@/lib/salary-calculator';
 type FlightRow = Database['public']['Tables']['flights']['Row'];
 type FlightInsert = Database['public']['Tables']['flights']['Insert'];
 
+/**
+ * Columns read by rowToFlightDuty when building a roster for friends comparison.
+ * Omits pay, original CSV data and edit/snapshot metadata, which the comparison
+ * never shows, so those bytes are not read or sent over the wire.
+ */
+export const ROSTER_COMPARISON_COLUMNS = [
+  'id',
+  'user_id',
+  'date',
+  'flight_number',
+  'flight_numbers',
+  'sector',
+  'sectors',
+  'duty_type',
+  'reporting_time',
+  'report_time',
+  'debriefing_time',
+  'debrief_time',
+  'hours',
+  'duty_hours',
+  'is_cross_day',
+  'data_source',
+  'month',
+  'year',
+  'sector_details',
+  'created_at',
+  'updated_at',
+].join(', ');
+
 /**
  * Converts FlightDuty to database insert format
  * Populates both old and new schema columns for backward compatibility
@@ -93,6 +122,20 @@ export function rowToFlightDuty(row: FlightRow): FlightDuty {
     };
   }
 
+  // Derive both sector flags in a single pass over the sector details
+  const sectorDetails = row.sector_details ? (row.sector_details as Sector[]) : undefined;
+  let hasFlaggedSectors: boolean | undefined;
+  let hasDeadheadSectors: boolean | undefined;
+
+  if (sectorDetails) {
+    hasFlaggedSectors = false;
+    hasDeadheadSectors = false;
+    for (const sector of sectorDetails) {
+      if (sector.isFlaggedSector) hasFlaggedSectors = true;
+      if (sector.isDeadhead) hasDeadheadSectors = true;
+    }
+  }
+
   return {
     id: row.id,
     userId: row.user_id,
@@ -111,13 +154,9 @@ export function rowToFlightDuty(row: FlightRow): FlightDuty {
     lastEditedBy: row.last_edited_by,
     month: row.month ?? new Date(row.date).getMonth() + 1,
     year: row.year ?? new Date(row.date).getFullYear(),
-    sectorDetails: row.sector_details ? (row.sector_details as Sector[]) : undefined,
-    hasFlaggedSectors: row.sector_details
-      ? (row.sector_details as Sector[]).some(s => s.isFlaggedSector)
-      : undefined,
-    hasDeadheadSectors: row.sector_details
-      ? (row.sector_details as Sector[]).some(s => s.isDeadhead)
-      : undefined,
+    sectorDetails,
+    hasFlaggedSectors,
+    hasDeadheadSectors,
     createdAt: new Date(row.created_at),
     updatedAt: new Date(row.updated_at)
   };
@@ -400,17 +439,19 @@ export async function updateFlightDuty(
       return { data: null, error: error.message };
     }
 
+    const updatedDuty = rowToFlightDuty(data);
+
     // Create audit trail entry
     await createAuditTrailEntry({
       flightId,
       userId,
       action: 'updated',
       oldData: currentData,
-      newData: rowToFlightDuty(data),
+      newData: updatedDuty,
       changeReason
     }, client);
 
-    return { data: rowToFlightDuty(data), error: null };
+    return { data: updatedDuty, error: null };
   } catch (error) {
     return { data: null, error: (error as Error).message };
   }
@@ -481,17 +522,19 @@ export async function revertFlightDuty(
       return { data: null, error: error.message };
     }
 
+    const revertedDuty = rowToFlightDuty(data);
+
     // Create audit trail entry (using 'updated' action since 'reverted' is not in DB constraint)
     await createAuditTrailEntry({
       flightId,
       userId,
       action: 'updated',
       oldData: currentData,
-      newData: rowToFlightDuty(data),
+      newData: revertedDuty,
       changeReason: changeReason || 'Reverted to original values'
     }, client);
 
-    return { data: rowToFlightDuty(data), error: null };
+    return { data: revertedDuty, error: null };
   } catch (error) {
     return { data: null, error: (error as Error).message };
   }
@@ -663,9 +706,10 @@ export async function deleteFlightDataByMonth(
 /**
  * Updates computed flight duty values (duty hours and flight pay) without marking as user-edited
  * Used for system recalculations (e.g., fixing BP duty calculations)
+ * Takes the already-loaded duty so the audit trail's old values need no re-fetch
  */
 export async function updateFlightDutyComputedValues(
-  flightId: string,
+  currentData: FlightDuty,
   updates: {
     dutyHours: number;
     flightPay: number;
@@ -677,11 +721,10 @@ export async function updateFlightDutyComputedValues(
   client: SupabaseClient = supabase
 ): Promise<{ success: boolean; error: string | null }> {
   try {
-    // Get current data for audit trail
-    const { data: currentData, error: fetchError } = await getFlightDutyById(flightId, userId, client);
+    const flightId = currentData.id;
 
-    if (fetchError || !currentData) {
-      return { success: false, error: fetchError || 'Flight duty not found' };
+    if (!flightId) {
+      return { success: false, error: 'Flight duty ID is required' };
     }
 
     // Update database with both old and new schema columns
@@ -699,16 +742,22 @@ export async function updateFlightDutyComputedValues(
     if (updates.positionUsed !== undefined) updatePayload.position_used = updates.positionUsed;
     if (updates.hourlyRateUsed !== undefined) updatePayload.hourly_rate_used = updates.hourlyRateUsed;
 
-    const { error } = await client
+    const { data: updatedRows, error } = await client
       .from('flights')
       .update(updatePayload)
       .eq('id', flightId)
-      .eq('user_id', userId);
+      .eq('user_id', userId)
+      .select('id');
 
     if (error) {
       return { success: false, error: error.message };
     }
 
+    // The flight may have been deleted while recalculation was running
+    if (!updatedRows || updatedRows.length === 0) {
+      return { success: false, error: 'Flight duty not found' };
+    }
+
     // Create audit trail entry for system recalculation
     await createAuditTrailEntry({
       flightId,
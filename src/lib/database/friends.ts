@@ -143,13 +143,16 @@ export async function getFriendsForUser(
       return { data: null, error: profilesError };
     }
 
+    // Index profiles by id once so each friendship resolves in O(1)
+    const profilesById = new Map((profiles ?? []).map((p) => [p.id, p] as const));
+
     // Map friendships to FriendWithProfile
     const friends: FriendWithProfile[] = data.map((friendship) => {
       const friendUserId =
         friendship.requester_id === userId
           ? friendship.receiver_id
           : friendship.requester_id;
-      const profile = profiles?.find((p) => p.id === friendUserId);
+      const profile = profilesById.get(friendUserId);
 
       return {
         friendshipId: friendship.id,
@@ -217,9 +220,12 @@ export async function getPendingFriendRequests(
       return { data: null, error: profilesError };
     }
 
+    // Index profiles by id once so each request resolves in O(1)
+    const profilesById = new Map((profiles ?? []).map((p) => [p.id, p] as const));
+
     // Map sent requests
     const sent: PendingRequest[] = sentRequests.map((friendship) => {
-      const profile = profiles?.find((p) => p.id === friendship.receiver_id);
+      const profile = profilesById.get(friendship.receiver_id);
       return {
         friendshipId: friendship.id,
         userId: friendship.receiver_id,
@@ -236,7 +242,7 @@ export async function getPendingFriendRequests(
 
     // Map received requests
     const received: PendingRequest[] = receivedRequests.map((friendship) => {
-      const profile = profiles?.find((p) => p.id === friendship.requester_id);
+      const profile = profilesById.get(friendship.requester_id);
       return {
         friendshipId: friendship.id,
         userId: friendship.requester_id,
@@ -327,6 +333,10 @@ export async function sendFriendRequest(
       .single();
 
     if (insertError) {
+      // A concurrent request for the same pair won the race to the unique index
+      if (insertError.code === '23505') {
+        return { data: null, error: 'Friend request already exists' };
+      }
       return { data: null, error: insertError.message };
     }
 
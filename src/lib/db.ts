@@ -5,6 +5,7 @@ import { PostgrestError } from '@supabase/supabase-js';
 type Profile = Database['public']['Tables']['profiles']['Row'];
 type ProfileInsert = Database['public']['Tables']['profiles']['Insert'];
 type ProfileUpdate = Database['public']['Tables']['profiles']['Update'];
+export type ProfileClaims = Pick<Profile, 'id' | 'airline' | 'position'>;
 
 // Flight types
 type Flight = Database['public']['Tables']['flights']['Row'];
@@ -21,18 +22,54 @@ type UserSettings = Database['public']['Tables']['user_settings']['Row'];
 type UserSettingsInsert = Database['public']['Tables']['user_settings']['Insert'];
 type UserSettingsUpdate = Database['public']['Tables']['user_settings']['Update'];
 
+// Concurrent reads for the same user (e.g. several components mounting on
+// page load) share one in-flight request instead of each hitting profiles.
+// Nothing is kept once the request settles, so every new read is fresh.
+type ProfileResult = { data: Profile | null; error: PostgrestError | null };
+type ProfileClaimsResult = { data: ProfileClaims | null; error: PostgrestError | null };
+const profileRequests = new Map<string, Promise<ProfileResult>>();
+const profileClaimsRequests = new Map<string, Promise<ProfileClaimsResult>>();
+
+function coalesceByUser<T>(
+  requests: Map<string, Promise<T>>,
+  userId: string,
+  load: () => Promise<T>
+): Promise<T> {
+  const inFlight = requests.get(userId);
+  if (inFlight) {
+    return inFlight;
+  }
+
+  const request = load().finally(() => requests.delete(userId));
+  requests.set(userId, request);
+  return request;
+}
+
 // Profile functions
-export async function getProfile(userId: string): Promise<{
-  data: Profile | null;
-  error: PostgrestError | null
-}> {
-  const { data, error } = await supabase
-    .from('profiles')
-    .select('*')
-    .eq('id', userId)
-    .single();
+export async function getProfile(userId: string): Promise<ProfileResult> {
+  return coalesceByUser(profileRequests, userId, async () => {
+    const { data, error } = await supabase
+      .from('profiles')
+      .select('*')
+      .eq('id', userId)
+      .single();
+
+    return { data, error };
+  });
+}
 
-  return { data, error };
+// Narrow primary-key lookup for callers that only need airline/position,
+// avoiding a full-row fetch of the profile
+export async function getProfileClaims(userId: string): Promise<ProfileClaimsResult> {
+  return coalesceByUser(profileClaimsRequests, userId, async () => {
+    const { data, error } = await supabase
+      .from('profiles')
+      .select('id, airline, position')
+      .eq('id', userId)
+      .single();
+
+    return { data, error };
+  });
 }
 
 export async function createProfile(profile: ProfileInsert): Promise<{
@@ -26,6 +26,26 @@ import { convertToFlightDuty } from './conversion';
 import { MIN_SUPPORTED_YEAR } from '@/lib/constants/dates';
 import { getUserPositionForMonth } from '@/lib/user-position-history';
 
+/**
+ * Returns a position resolver scoped to a single workflow call.
+ * Batch entries usually share a month, so each (year, month) is resolved from
+ * the position timeline once per call instead of once per entry. Nothing is
+ * cached beyond the call, so timeline changes are always picked up.
+ */
+function createWorkflowPositionResolver(userId: string): (year: number, month: number) => Promise<Position> {
+  const resolved = new Map<string, Promise<Position>>();
+
+  return (year, month) => {
+    const key = `${year}-${month}`;
+    let position = resolved.get(key);
+    if (!position) {
+      position = getUserPositionForMonth(userId, year, month);
+      resolved.set(key, position);
+    }
+    return position;
+  };
+}
+
 /**
  * Validates manual entry data in real-time.
  * `position` is passed from the UI (resolved from the position timeline when
@@ -144,6 +164,7 @@ export async function processBatchManualEntries(
   const errors: string[] = [];
   const warnings: string[] = [];
   const flightDuties: FlightDuty[] = [];
+  const resolvePosition = createWorkflowPositionResolver(userId);
 
   try {
     // Validate and convert all entries, resolving position per-entry date
@@ -153,7 +174,7 @@ export async function processBatchManualEntries(
       const entryYear = entryDate.getFullYear();
       const entryMonth = entryDate.getMonth() + 1;
 
-      const position = await getUserPositionForMonth(userId, entryYear, entryMonth);
+      const position = await resolvePosition(entryYear, entryMonth);
       const validation = validateManualEntry(entry, position, entryYear);
 
       if (!validation.valid) {
@@ -173,7 +194,7 @@ export async function processBatchManualEntries(
       const entryDate = entry.date ? new Date(entry.date) : new Date();
       const entryYear = entryDate.getFullYear();
       const entryMonth = entryDate.getMonth() + 1;
-      const position = await getUserPositionForMonth(userId, entryYear, entryMonth);
+      const position = await resolvePosition(entryYear, entryMonth);
 
       const converted = convertToFlightDuty(entry, userId, position);
       if (!converted) {
@@ -199,7 +220,7 @@ export async function processBatchManualEntries(
 
     // Resolve position for the first flight's month for layover/monthly calculations
     const firstFlight = flightDuties[0];
-    const batchPosition = await getUserPositionForMonth(userId, firstFlight.year, firstFlight.month);
+    const batchPosition = await resolvePosition(firstFlight.year, firstFlight.month);
 
     const layoverRestPeriods = calculateLayoverRestPeriods(flightDuties, userId, batchPosition);
 
@@ -253,6 +274,7 @@ export async function processManualEntryBatch(
   const errors: string[] = [];
   const warnings: string[] = [];
   const flightDuties: FlightDuty[] = [];
+  const resolvePosition = createWorkflowPositionResolver(userId);
 
   try {
     // Validate and convert all entries
@@ -262,7 +284,7 @@ export async function processManualEntryBatch(
       const entryYear = entryDate.getFullYear();
       const entryMonth = entryDate.getMonth() + 1;
 
-      const position = await getUserPositionForMonth(userId, entryYear, entryMonth);
+      const position = await resolvePosition(entryYear, entryMonth);
       const validation = validateManualEntry(entry, position, entryYear);
 
       if (!validation.valid) {
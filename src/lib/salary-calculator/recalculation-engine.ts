@@ -116,7 +116,7 @@ export async function recalculateMonthlyTotals(
 
         // Always write snapshot columns even if computed values didn't change
         const updateResult = await updateFlightDutyComputedValues(
-          duty.id!,
+          duty,
           {
             dutyHours: needsUpdate ? newDutyHours : duty.dutyHours,
             flightPay: needsUpdate ? newFlightPay : duty.flightPay,